@@ -1,18 +1,30 @@
 import logging
 import re
 import os
-import csv
-import io
+import hashlib
+import base64
 import jwt
+import orjson
 import datetime
+import calendar
+import threading
+import queue
+import time
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
-from flask import Flask, request, jsonify, Response
+from cachetools import TTLCache
+from flask import Flask, request, jsonify, Response, stream_with_context, url_for
+from flask.json.provider import JSONProvider
+from werkzeug.middleware.proxy_fix import ProxyFix
 from flask_pymongo import PyMongo
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from pymongo.errors import DuplicateKeyError
+from pymongo.errors import DuplicateKeyError, PyMongoError
+from pymongo.write_concern import WriteConcern
 from bson import ObjectId
+import gridfs
 from dotenv import load_dotenv
 
 # --- CONFIGURATION ---
@@ -22,6 +34,8 @@ SECRET_KEY = os.getenv("SECRET_KEY", "default_fallback_key")
 ADMIN_USERNAME = os.getenv("ADMIN_USERNAME", "admin")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
 MONGO_URI = os.getenv("MONGO_URI")
+# Shared limiter backend, e.g. redis://localhost:6379/0; in-memory only suits a single worker
+RATELIMIT_STORAGE_URI = os.getenv("RATELIMIT_STORAGE_URI", "memory://")
 
 if not MONGO_URI:
     raise ValueError("No MONGO_URI found in environment variables.")
@@ -32,29 +46,100 @@ if not ADMIN_PASSWORD:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__, static_folder='.', static_url_path='')
+# Set SERVE_STATIC=0 when nginx/CDN serves the site files (see nginx.conf)
+SERVE_STATIC = os.getenv("SERVE_STATIC", "1") == "1"
+# Set BEHIND_PROXY=1 so client IPs (rate limits) and URLs come from X-Forwarded-* headers
+BEHIND_PROXY = os.getenv("BEHIND_PROXY", "0") == "1"
+
+# --- JSON ---
+class OrjsonProvider(JSONProvider):
+    """ Encode jsonify() responses with orjson instead of the stdlib json module """
+
+    @staticmethod
+    def _default(obj):
+        if isinstance(obj, ObjectId):
+            return str(obj)
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self._default, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Flask(__name__, static_folder='.' if SERVE_STATIC else None, static_url_path='')
+if BEHIND_PROXY:
+    # Host comes from nginx's own 'Host $host'; X-Forwarded-Host isn't trusted
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1)
 # Increase max content length for image uploads (e.g., 5MB)
 app.config['MAX_CONTENT_LENGTH'] = 5 * 1024 * 1024 
 CORS(app)
 
 # --- RATE LIMITER ---
-limiter = Limiter(get_remote_address, app=app, default_limits=["500 per day", "100 per hour"])
+limiter = Limiter(
+    get_remote_address,
+    app=app,
+    storage_uri=RATELIMIT_STORAGE_URI,
+    default_limits=["500 per day", "100 per hour"]
+)
 
 # --- DATABASE ---
 app.config["MONGO_URI"] = MONGO_URI
-mongo = PyMongo(app)
+# Small per-worker pool, pre-warmed, with fail-fast timeouts so many workers
+# don't exhaust the Atlas connection limit or hang on an unreachable cluster
+mongo = PyMongo(
+    app,
+    maxPoolSize=20,
+    minPoolSize=5,
+    serverSelectionTimeoutMS=3000,
+    connectTimeoutMS=3000,
+    socketTimeoutMS=10000,
+    retryWrites=True
+)
+
+# Must come after PyMongo(app): its init_app installs its own BSONProvider
+app.json = OrjsonProvider(app)
+
+# --- PROJECTIONS ---
+# Only fetch the fields each endpoint actually serializes
+VOLUNTEER_LIST_FIELDS = {"name": 1, "email": 1, "phone": 1, "message": 1, "registered_at": 1}
+# 'image' only exists on legacy items stored before images moved to GridFS
+NEWS_LIST_FIELDS = {"title": 1, "content": 1, "image_id": 1, "image": 1, "date": 1}
+# Newest-first listing order; _id breaks ties between equal timestamps so
+# keyset pages never skip or repeat rows
+VOLUNTEER_PAGE_SORT = [("registered_at", -1), ("_id", -1)]
+
+# Registrations only need the primary's ack; audit entries must survive failover
+volunteer_writes = mongo.db.get_collection("volunteers", write_concern=WriteConcern(w=1))
+audit_writes = mongo.db.get_collection("audit_logs", write_concern=WriteConcern(w="majority"))
+
+# News images live in GridFS so news documents stay small
+news_images = gridfs.GridFS(mongo.db, collection="news_images")
+
+# Shared pool for overlapping independent DB round-trips within one request
+db_executor = ThreadPoolExecutor(max_workers=8)
 
 # Ensure Indexes
 with app.app_context():
     try:
+        # Open the pool during boot rather than on the first user request
+        mongo.db.command("ping")
         mongo.db.volunteers.create_index("email", unique=True)
         mongo.db.volunteers.create_index("phone", unique=True)
-        mongo.db.volunteers.create_index("registered_at")
+        mongo.db.volunteers.create_index(VOLUNTEER_PAGE_SORT)
+        mongo.db.volunteers.create_index(
+            [("name", "text"), ("email", "text"), ("phone", "text")],
+            name="volunteer_search_text"
+        )
         mongo.db.news.create_index("date")
     except Exception as e:
         logger.error(f"Index creation error: {e}")
 
 # --- SECURITY DECORATOR ---
+# Token digest -> exp timestamp for tokens that already passed jwt.decode
+verified_tokens = TTLCache(maxsize=1024, ttl=60)
+verified_tokens_lock = threading.Lock()
+
 def token_required(f):
     @wraps(f)
     def decorated(*args, **kwargs):
@@ -67,28 +152,183 @@ def token_required(f):
         if not token:
             return jsonify({"message": "Token is missing!"}), 401
 
-        try:
-            jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
-        except jwt.ExpiredSignatureError:
-            return jsonify({"message": "Token has expired!"}), 401
-        except jwt.InvalidTokenError:
-            return jsonify({"message": "Invalid token!"}), 401
+        # Recently verified tokens skip the signature check until they expire
+        token_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+        with verified_tokens_lock:
+            exp = verified_tokens.get(token_key)
+
+        if exp is None or exp <= time.time():
+            try:
+                payload = jwt.decode(token, SECRET_KEY, algorithms=["HS256"])
+            except jwt.ExpiredSignatureError:
+                return jsonify({"message": "Token has expired!"}), 401
+            except jwt.InvalidTokenError:
+                return jsonify({"message": "Invalid token!"}), 401
+            if 'exp' in payload:
+                with verified_tokens_lock:
+                    verified_tokens[token_key] = payload['exp']
         
         return f(*args, **kwargs)
     return decorated
 
+# --- COUNT HELPER ---
+# Filtered totals are cached briefly so page flips don't re-count the collection
+search_count_cache = TTLCache(maxsize=256, ttl=5)
+search_count_lock = threading.Lock()
+
+def count_volunteers(query, search):
+    if not search:
+        # Uses collection metadata instead of walking the index
+        return mongo.db.volunteers.estimated_document_count()
+
+    with search_count_lock:
+        total = search_count_cache.get(search)
+    if total is None:
+        total = mongo.db.volunteers.count_documents(query)
+        with search_count_lock:
+            search_count_cache[search] = total
+    return total
+
+# --- STATS CACHE ---
+# Swapped as a whole dict so readers never see a half-updated entry. The
+# generation is bumped on every invalidation so a request that counted
+# before a registration can't store its stale result afterwards
+STATS_TTL_SECONDS = 5
+stats_cache = {"day": None, "expires": 0, "data": None}
+stats_generation = 0
+stats_lock = threading.Lock()
+
+def invalidate_stats():
+    global stats_cache, stats_generation
+    with stats_lock:
+        stats_generation += 1
+        stats_cache = {"day": None, "expires": 0, "data": None}
+
+# --- CSV HELPER ---
+def csv_row(fields):
+    """ Encode one CSV line; every field is quoted, so commas/quotes/newlines are safe """
+    # None becomes an empty field, as with csv.writer
+    return (",".join(
+        '"' + ("" if f is None else str(f)).replace('"', '""') + '"' for f in fields
+    ) + "\r\n").encode("utf-8")
+
+# --- VALIDATION HELPERS ---
+# Compiled once at import; mirrors the 10-12 digit rule on the volunteer form
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+PHONE_RE = re.compile(r'[0-9]{10,12}')
+
+def is_valid_email(email):
+    return isinstance(email, str) and EMAIL_RE.fullmatch(email) is not None
+
+def is_valid_phone(phone):
+    return isinstance(phone, str) and PHONE_RE.fullmatch(phone) is not None
+
+# --- DATE HELPER ---
+# Month names resolved once; calendar.month_name re-runs strftime on every lookup
+MONTH_NAMES = tuple(calendar.month_name)
+
+def format_news_date(d):
+    """ Same output as strftime("%B %d, %Y") without the per-call locale formatting """
+    return f"{MONTH_NAMES[d.month]} {d.day:02d}, {d.year}"
+
+# --- IMAGE HELPER ---
+def decode_image(data_url):
+    """ Split a browser data URL (data:<type>;base64,<payload>) into bytes and content type """
+    content_type = "application/octet-stream"
+    payload = data_url
+    if data_url.startswith("data:") and "," in data_url:
+        header, payload = data_url.split(",", 1)
+        content_type = header[len("data:"):].split(";")[0] or content_type
+    return base64.b64decode(payload, validate=True), content_type
+
+def is_allowed_image_type(content_type):
+    """ Raster images only: the image route is public and same-origin, so no HTML or SVG """
+    content_type = content_type.lower()
+    return content_type.startswith("image/") and content_type != "image/svg+xml"
+
 # --- AUDIT LOG HELPER ---
-def log_audit(action, details=""):
+# Entries are queued and bulk-inserted by a background writer, keeping the
+# Mongo round-trip off the request path
+AUDIT_BATCH_SIZE = 100
+AUDIT_FLUSH_SECONDS = 1.0
+# Upper bound on how long process exit waits for the writer's last batch
+AUDIT_SHUTDOWN_SECONDS = 10.0
+# Queued at exit to tell the writer to flush its batch and stop
+AUDIT_STOP = object()
+audit_queue = queue.Queue()
+audit_writer = None
+audit_writer_lock = threading.Lock()
+
+def write_audit_entries(entries):
     try:
-        mongo.db.audit_logs.insert_one({
-            "action": action,
-            "details": details,
-            "admin": ADMIN_USERNAME,
-            "timestamp": datetime.datetime.utcnow()
-        })
+        audit_writes.insert_many(entries, ordered=False)
     except Exception as e:
         logger.error(f"Audit log failed: {e}")
 
+def run_audit_writer():
+    while True:
+        stop = False
+        entries = []
+        item = audit_queue.get()
+        if item is AUDIT_STOP:
+            return
+        entries.append(item)
+        deadline = time.monotonic() + AUDIT_FLUSH_SECONDS
+        while len(entries) < AUDIT_BATCH_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = audit_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is AUDIT_STOP:
+                stop = True
+                break
+            entries.append(item)
+        write_audit_entries(entries)
+        if stop:
+            return
+
+def ensure_audit_writer():
+    # Started lazily so each forked worker gets its own thread
+    global audit_writer
+    if audit_writer is not None and audit_writer.is_alive():
+        return
+    with audit_writer_lock:
+        if audit_writer is None or not audit_writer.is_alive():
+            audit_writer = threading.Thread(target=run_audit_writer, name="audit-writer", daemon=True)
+            audit_writer.start()
+
+@atexit.register
+def flush_audit_queue():
+    # Let the writer finish the batch it is holding, then write anything
+    # queued after the stop marker (or when the writer never started)
+    writer = audit_writer
+    if writer is not None and writer.is_alive():
+        audit_queue.put(AUDIT_STOP)
+        writer.join(timeout=AUDIT_SHUTDOWN_SECONDS)
+
+    entries = []
+    while True:
+        try:
+            item = audit_queue.get_nowait()
+        except queue.Empty:
+            break
+        if item is not AUDIT_STOP:
+            entries.append(item)
+    if entries:
+        write_audit_entries(entries)
+
+def log_audit(action, details=""):
+    ensure_audit_writer()
+    audit_queue.put({
+        "action": action,
+        "details": details,
+        "admin": ADMIN_USERNAME,
+        "timestamp": datetime.datetime.utcnow()
+    })
+
 # --- EXISTING ROUTES ---
 
 @app.route('/api/admin/login', methods=['POST'])
@@ -112,14 +352,32 @@ def admin_login():
 @app.route('/api/admin/stats', methods=['GET'])
 @token_required
 def get_stats():
+    global stats_cache
     try:
         now = datetime.datetime.utcnow()
         start_of_day = datetime.datetime(now.year, now.month, now.day)
+
+        # Dashboards poll this; reuse a recent result for the same day
+        cached = stats_cache
+        if cached["day"] == start_of_day and time.monotonic() < cached["expires"]:
+            return jsonify({"success": True, "data": cached["data"]}), 200
+        generation = stats_generation
         
-        total = mongo.db.volunteers.count_documents({})
-        today_count = mongo.db.volunteers.count_documents({"registered_at": {"$gte": start_of_day}})
+        # Total comes from collection metadata; only today's count touches the
+        # (registered_at, _id) index, and both run concurrently
+        total_future = db_executor.submit(mongo.db.volunteers.estimated_document_count)
+        today_future = db_executor.submit(
+            mongo.db.volunteers.count_documents, {"registered_at": {"$gte": start_of_day}}
+        )
+        total = total_future.result()
+        today_count = today_future.result()
+
+        data = {"total": total, "today": today_count}
+        with stats_lock:
+            if stats_generation == generation:
+                stats_cache = {"day": start_of_day, "expires": time.monotonic() + STATS_TTL_SECONDS, "data": data}
         
-        return jsonify({"success": True, "data": {"total": total, "today": today_count}}), 200
+        return jsonify({"success": True, "data": data}), 200
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
@@ -128,20 +386,28 @@ def get_stats():
 def export_volunteers():
     try:
         log_audit("EXPORT_CSV", "Exported volunteer list")
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(['Registered At', 'Name', 'Email', 'Phone', 'Message'])
-        volunteers = mongo.db.volunteers.find().sort("registered_at", -1)
-        for v in volunteers:
-            writer.writerow([
-                v['registered_at'].strftime("%Y-%m-%d %H:%M:%S"),
-                v['name'],
-                v['email'],
-                v['phone'],
-                v.get('message', '')
-            ])
+        volunteers = mongo.db.volunteers.find({}, VOLUNTEER_LIST_FIELDS).sort("registered_at", -1).batch_size(1000)
+
+        def generate():
+            # Build rows by hand and send them as bytes, one chunk per cursor batch
+            yield csv_row(['Registered At', 'Name', 'Email', 'Phone', 'Message'])
+            rows = []
+            for v in volunteers:
+                rows.append(csv_row([
+                    v['registered_at'].isoformat(sep=' ', timespec='seconds'),
+                    v['name'],
+                    v['email'],
+                    v['phone'],
+                    v.get('message', '')
+                ]))
+                if len(rows) == 1000:
+                    yield b"".join(rows)
+                    rows = []
+            if rows:
+                yield b"".join(rows)
+
         return Response(
-            output.getvalue(),
+            stream_with_context(generate()),
             mimetype="text/csv",
             headers={"Content-disposition": "attachment; filename=volunteers_list.csv"}
         )
@@ -151,14 +417,17 @@ def export_volunteers():
 @app.route('/api/volunteers/<id>', methods=['DELETE'])
 @token_required
 def delete_volunteer(id):
+    if not ObjectId.is_valid(id):
+        return jsonify({"success": False, "message": "Invalid id"}), 400
     try:
         result = mongo.db.volunteers.delete_one({"_id": ObjectId(id)})
         if result.deleted_count == 1:
+            invalidate_stats()
             log_audit("DELETE_VOLUNTEER", f"Deleted volunteer ID: {id}")
             return jsonify({"success": True, "message": "Volunteer deleted"}), 200
         else:
             return jsonify({"success": False, "message": "Volunteer not found"}), 404
-    except Exception as e:
+    except PyMongoError as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
 @app.route('/api/volunteers', methods=['GET'])
@@ -168,29 +437,69 @@ def get_volunteers():
         page = int(request.args.get('page', 1))
         limit = int(request.args.get('limit', 10))
         search = request.args.get('search', '')
+        before = request.args.get('before')
         skip = (page - 1) * limit
 
         query = {}
-        if search:
-            query["$or"] = [
-                {"name": {"$regex": search, "$options": "i"}},
-                {"email": {"$regex": search, "$options": "i"}},
-                {"phone": {"$regex": search, "$options": "i"}}
-            ]
-
-        cursor = mongo.db.volunteers.find(query).sort("registered_at", -1).skip(skip).limit(limit)
-        total_volunteers = mongo.db.volunteers.count_documents(query)
-
-        volunteers_list = []
-        for v in cursor:
-            volunteers_list.append({
-                "id": str(v['_id']),
-                "name": v['name'],
-                "email": v['email'],
-                "phone": v['phone'],
-                "message": v.get('message', 'N/A'),
-                "date": v['registered_at'].strftime("%Y-%m-%d %H:%M:%S")
-            })
+        projection = VOLUNTEER_LIST_FIELDS
+        sort = VOLUNTEER_PAGE_SORT
+        if search.isdigit():
+            # Anchored prefix match can walk the unique phone index
+            query = {"phone": {"$regex": "^" + re.escape(search)}}
+        elif "@" in search:
+            # The text tokenizer splits on '@' and '.', so emails use a prefix
+            # match on the unique email index instead (case-sensitive)
+            query = {"email": {"$regex": "^" + re.escape(search)}}
+        elif search:
+            # Searched as a quoted phrase so every word must match. Text search
+            # only matches whole words: partial names (e.g. "Ram" for "Ramesh")
+            # no longer match
+            phrase = search.replace('"', ' ').strip()
+            query = {"$text": {"$search": f'"{phrase}"'}}
+            projection = {**VOLUNTEER_LIST_FIELDS, "score": {"$meta": "textScore"}}
+            # _id breaks score ties so skip-based pages stay stable
+            sort = [("score", {"$meta": "textScore"}), ("_id", -1)]
+
+        by_date = sort is VOLUNTEER_PAGE_SORT
+        if before and by_date:
+            # Keyset pagination: continue after the last (registered_at, _id) seen
+            # instead of skipping. The cursor looks like "<iso timestamp>_<id>"
+            before_ts, _, before_id = before.rpartition("_")
+            try:
+                before_dt = datetime.datetime.fromisoformat(before_ts)
+            except ValueError:
+                before_dt = None
+            if before_dt is None or not ObjectId.is_valid(before_id):
+                return jsonify({"success": False, "message": "Invalid 'before' cursor"}), 400
+            page_query = {**query, "$or": [
+                {"registered_at": {"$lt": before_dt}},
+                {"registered_at": before_dt, "_id": {"$lt": ObjectId(before_id)}}
+            ]}
+            skip = 0
+        else:
+            page_query = query
+
+        # Count (without the cursor bound) in the background while the page is fetched
+        total_future = db_executor.submit(count_volunteers, query, search)
+
+        # VOLUNTEER_PAGE_SORT has a matching index, so the planner walks it
+        # (and merges both keyset $or branches) without a hint
+        cursor = mongo.db.volunteers.find(page_query, projection).sort(sort).skip(skip).limit(limit).batch_size(500)
+
+        docs = list(cursor)
+        volunteers_list = [{
+            "id": str(v['_id']),
+            "name": v['name'],
+            "email": v['email'],
+            "phone": v['phone'],
+            "message": v.get('message', 'N/A'),
+            "date": v['registered_at'].isoformat(sep=' ', timespec='seconds')
+        } for v in docs]
+        total_volunteers = total_future.result()
+
+        next_before = None
+        if by_date and docs and len(docs) == limit:
+            next_before = f"{docs[-1]['registered_at'].isoformat()}_{docs[-1]['_id']}"
 
         return jsonify({
             "success": True,
@@ -199,7 +508,8 @@ def get_volunteers():
                 "pagination": {
                     "current_page": page,
                     "limit": limit,
-                    "total_records": total_volunteers
+                    "total_records": total_volunteers,
+                    "next_before": next_before
                 }
             }
         }), 200
@@ -215,14 +525,19 @@ def register_volunteer():
         data = request.json
         if not data or not all(k in data for k in ('name', 'email', 'phone')):
             return jsonify({"success": False, "message": "Missing fields"}), 400
+        if not is_valid_email(data['email']):
+            return jsonify({"success": False, "message": "Invalid email"}), 400
+        if not is_valid_phone(data['phone']):
+            return jsonify({"success": False, "message": "Invalid phone number"}), 400
             
-        mongo.db.volunteers.insert_one({
+        volunteer_writes.insert_one({
             "name": data['name'],
             "email": data['email'],
             "phone": data['phone'],
             "message": data.get('message', ''),
             "registered_at": datetime.datetime.utcnow()
         })
+        invalidate_stats()
         return jsonify({"success": True, "message": "Registered!"}), 201
     except DuplicateKeyError:
         return jsonify({"success": False, "message": "Email/Phone already exists"}), 409
@@ -236,20 +551,51 @@ def get_news():
     """ Public endpoint to get news updates """
     try:
         # Sort by date descending
-        cursor = mongo.db.news.find().sort("date", -1)
+        cursor = mongo.db.news.find({}, NEWS_LIST_FIELDS).sort("date", -1)
         news_list = []
         for n in cursor:
+            image = n.get('image', None)
+            if n.get('image_id'):
+                image = url_for('get_news_image', id=n['image_id'], _external=True)
             news_list.append({
                 "id": str(n['_id']),
                 "title": n['title'],
                 "content": n['content'],
-                "image": n.get('image', None), # Retrieve image
-                "date": n['date'].strftime("%B %d, %Y") # Friendly date format
+                "image": image, # Image URL (or inline data for legacy items)
+                "date": format_news_date(n['date']) # Friendly date format
             })
         return jsonify({"success": True, "data": news_list}), 200
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
+@app.route('/api/news/image/<id>', methods=['GET'])
+@limiter.exempt # Fetched once per news card, so per-IP API limits don't fit
+def get_news_image(id):
+    """ Public endpoint to stream a news image from GridFS """
+    if not ObjectId.is_valid(id):
+        return jsonify({"success": False, "message": "Invalid id"}), 400
+    try:
+        image = news_images.get(ObjectId(id))
+    except gridfs.NoFile:
+        return jsonify({"success": False, "message": "Image not found"}), 404
+    except PyMongoError as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+    content_type = (image.metadata or {}).get("content_type", "")
+    if not is_allowed_image_type(content_type):
+        content_type = "application/octet-stream"
+
+    # Images are never modified in place, so browsers can keep them.
+    # readchunk() yields GridFS chunks; iterating GridOut would split on newlines
+    return Response(
+        iter(image.readchunk, b""),
+        mimetype=content_type,
+        headers={
+            "Cache-Control": "public, max-age=604800, immutable",
+            "X-Content-Type-Options": "nosniff"
+        }
+    )
+
 @app.route('/api/news', methods=['POST'])
 @token_required
 def add_news():
@@ -266,11 +612,25 @@ def add_news():
             "date": datetime.datetime.utcnow()
         }
         
-        # Add image if present (Base64 string)
+        # Store image in GridFS if present (Base64 data URL)
         if data.get('image'):
-            news_item['image'] = data['image']
+            if not isinstance(data['image'], str):
+                return jsonify({"success": False, "message": "Invalid image data"}), 400
+            try:
+                blob, content_type = decode_image(data['image'])
+            except ValueError:
+                return jsonify({"success": False, "message": "Invalid image data"}), 400
+            if not is_allowed_image_type(content_type):
+                return jsonify({"success": False, "message": "Unsupported image type"}), 400
+            news_item['image_id'] = str(news_images.put(blob, metadata={"content_type": content_type}))
 
-        mongo.db.news.insert_one(news_item)
+        try:
+            mongo.db.news.insert_one(news_item)
+        except Exception:
+            # Don't leave an orphaned image behind if the news item wasn't saved
+            if news_item.get('image_id'):
+                news_images.delete(ObjectId(news_item['image_id']))
+            raise
         
         log_audit("ADD_NEWS", f"Added news: {data['title']}")
         return jsonify({"success": True, "message": "News added successfully"}), 201
@@ -280,15 +640,20 @@ def add_news():
 @app.route('/api/news/<id>', methods=['DELETE'])
 @token_required
 def delete_news(id):
+    if not ObjectId.is_valid(id):
+        return jsonify({"success": False, "message": "Invalid id"}), 400
     try:
-        result = mongo.db.news.delete_one({"_id": ObjectId(id)})
-        if result.deleted_count == 1:
+        deleted = mongo.db.news.find_one_and_delete({"_id": ObjectId(id)}, {"image_id": 1})
+        if deleted:
+            if deleted.get('image_id'):
+                news_images.delete(ObjectId(deleted['image_id']))
             log_audit("DELETE_NEWS", f"Deleted news ID: {id}")
             return jsonify({"success": True, "message": "News deleted"}), 200
         else:
             return jsonify({"success": False, "message": "News item not found"}), 404
-    except Exception as e:
+    except PyMongoError as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
 if __name__ == '__main__':
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    # Local development only; production runs under gunicorn (gunicorn.conf.py)
+    app.run(host='0.0.0.0', port=5000, debug=os.getenv("FLASK_DEBUG") == "1")
\ No newline at end of file
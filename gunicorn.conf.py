@@ -0,0 +1,19 @@
+import os
+
+# --- SERVER ---
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:5000")
+
+# Threaded workers: the API is I/O-bound on Mongo, so threads overlap round-trips
+workers = int(os.getenv("WEB_CONCURRENCY", max(2, 2 * (os.cpu_count() or 1) + 1)))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", 8))
+keepalive = 5
+timeout = 60
+
+# Not preloaded on purpose: MongoClient isn't fork-safe, so each worker
+# opens its own pool (index creation at import is idempotent)
+preload_app = False
+
+# --- LOGGING ---
+accesslog = "-"
+errorlog = "-"